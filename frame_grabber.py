@@ -0,0 +1,68 @@
+import queue
+import threading
+
+import cv2
+
+
+class FrameGrabber:
+    def __init__(self, source=0, width=1280, height=720):
+        """
+        Read camera frames on a background thread, keeping only the latest one.
+
+        :param source: Camera index or video path passed to cv2.VideoCapture
+        :param width: Requested capture width
+        :param height: Requested capture height
+        """
+        self.cap = cv2.VideoCapture(source)
+        self.cap.set(3, width)  # Width
+        self.cap.set(4, height)  # Height
+
+        # Single-slot buffer: a newer frame always replaces an unread one
+        self._frames = queue.Queue(maxsize=1)
+        self._stopped = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        # Start the capture thread.
+        self._thread.start()
+        return self
+
+    def _post(self, item):
+        # Drop the stale frame if the consumer has not picked it up yet
+        try:
+            self._frames.get_nowait()
+        except queue.Empty:
+            pass
+        self._frames.put_nowait(item)
+
+    def _run(self):
+        try:
+            while not self._stopped.is_set():
+                success, frame = self.cap.read()
+                self._post((success, frame))
+
+                if not success:
+                    break
+        finally:
+            # Always leave a failed read behind so a waiting read() returns,
+            # even if cap.read() raised
+            self._post((False, None))
+
+    def read(self, timeout=None):
+        """
+        Return the most recent frame, waiting for a new one if necessary.
+
+        :param timeout: Seconds to wait before reporting a failed read (None waits indefinitely)
+        :return: (success, frame) like cv2.VideoCapture.read
+        """
+        try:
+            return self._frames.get(timeout=timeout)
+        except queue.Empty:
+            return False, None
+
+    def stop(self):
+        # Stop the capture thread and release the camera.
+        self._stopped.set()
+        if self._thread.is_alive():
+            self._thread.join()
+        self.cap.release()
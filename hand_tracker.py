@@ -20,13 +20,31 @@ class HandLandmark(Enum):
     # Add more landmarks as needed
 
 
+# Plain int landmark indices for per-frame code (avoids Enum .value lookups)
+THUMB_MCP = HandLandmark.THUMB_MCP.value
+THUMB_TIP = HandLandmark.THUMB_TIP.value
+INDEX_TIP = HandLandmark.INDEX_TIP.value
+MIDDLE_TIP = HandLandmark.MIDDLE_TIP.value
+RING_TIP = HandLandmark.RING_TIP.value
+PINKY_TIP = HandLandmark.PINKY_TIP.value
+
+# Index, middle, ring and pinky tips and their PIP joints, used by detect_gesture
+FINGERTIP_LANDMARKS = np.array([INDEX_TIP, MIDDLE_TIP, RING_TIP, PINKY_TIP])
+FINGER_PIP_LANDMARKS = np.array([6, 10, 14, 18])
+
+
 class EnhancedHandTracker:
-    def __init__(self, mode=False, max_hands=2, detection_confidence=0.7, tracking_confidence=0.7):
+    def __init__(self, mode=False, max_hands=2, detection_confidence=0.7, tracking_confidence=0.7,
+                 input_width=640, stride=2):
        # Initialize MediaPipe Hands tracking with enhanced configuration.
+       # input_width is the width frames are shrunk to before inference (None keeps full size).
+       # stride runs inference on every stride-th frame and reuses the last results in between.
         self.mode = mode
         self.max_hands = max_hands
         self.detection_confidence = detection_confidence
         self.tracking_confidence = tracking_confidence
+        self.input_width = input_width
+        self.stride = max(1, stride)
 
         # MediaPipe hands solution
         self.mp_hands = mp.solutions.hands
@@ -39,16 +57,53 @@ class EnhancedHandTracker:
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
 
-# Detect hands in the image.
-    def detect_hands(self, image, draw=True):
-        # Convert BGR to RGB
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+        # Per-frame state filled in by find_hands
+        self._frame_idx = 0
+        self.results = None
+        self.landmarks_px = None  # (21, 2) int32 pixel coordinates of the first hand
+        self.frame_size = (0, 0)
+
+    def _landmarks_to_px(self, hand_landmarks):
+        # Convert normalized landmarks of one hand to an (N, 2) int32 pixel array.
+        width, height = self.frame_size
+        # float64 keeps the truncated pixels identical to int(lm.x * width)
+        coords = np.asarray([(lm.x, lm.y) for lm in hand_landmarks.landmark], dtype=np.float64)
+        return (coords * (width, height)).astype(np.int32)
+
+    def find_hands(self, rgb_image):
+        # Run hand inference on an RGB image without drawing; safe to call off the main thread.
+
+        # Between strided frames keep the previous results and landmarks
+        run_inference = self._frame_idx % self.stride == 0
+        self._frame_idx += 1
+        if not run_inference and self.results is not None:
+            return self.results
+
+        # Landmarks are normalized, so inference can run on a smaller copy
+        height, width, _ = rgb_image.shape
+        if self.input_width and width > self.input_width:
+            input_height = round(height * self.input_width / width)
+            rgb_image = cv2.resize(rgb_image, (self.input_width, input_height),
+                                   interpolation=cv2.INTER_AREA)
+
+        # A read-only input is wrapped by MediaPipe instead of copied into its graph
+        rgb_image = rgb_image.view()
+        rgb_image.flags.writeable = False
 
-        # Process the image and find hands
         self.results = self.hands.process(rgb_image)
 
-        # Draw hand landmarks if requested and hands are detected
-        if draw and self.results.multi_hand_landmarks:
+        # Cache pixel landmarks of the first hand once for all getters this frame
+        self.frame_size = (width, height)
+        if self.results.multi_hand_landmarks:
+            self.landmarks_px = self._landmarks_to_px(self.results.multi_hand_landmarks[0])
+        else:
+            self.landmarks_px = None
+
+        return self.results
+
+    def draw_hands(self, image):
+        # Draw the landmarks found by the last find_hands call.
+        if self.results and self.results.multi_hand_landmarks:
             for hand_landmarks in self.results.multi_hand_landmarks:
                 self.mp_drawing.draw_landmarks(
                     image,
@@ -60,60 +115,60 @@ class EnhancedHandTracker:
 
         return image
 
-    def get_hand_landmarks(self, image, hand_index=0):
-      #Get pixel coordinates of hand landmarks.
-        landmarks = []
-        height, width, _ = image.shape
+# Detect hands in the image.
+    def detect_hands(self, image, draw=True, rgb=None):
+        # Convert BGR to RGB unless an already converted copy of the frame is given
+        if rgb is None:
+            rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
 
-        if self.results.multi_hand_landmarks:
-            hand_landmarks = self.results.multi_hand_landmarks[hand_index]
+        # Process the image and find hands
+        self.find_hands(rgb)
+
+        # Draw hand landmarks if requested and hands are detected
+        if draw:
+            self.draw_hands(image)
 
-            for landmark in hand_landmarks.landmark:
-                # Convert normalized coordinates to pixel coordinates
-                x = int(landmark.x * width)
-                y = int(landmark.y * height)
-                landmarks.append((x, y))
+        return image
 
-        return landmarks
+    def get_hand_landmarks(self, hand_index=0):
+      #Get pixel coordinates of hand landmarks from the last find_hands call.
+        if not self.results or not self.results.multi_hand_landmarks:
+            return []
 
-    def detect_gesture(self, image):
+        if hand_index == 0:
+            landmarks = self.landmarks_px
+        elif hand_index < len(self.results.multi_hand_landmarks):
+            landmarks = self._landmarks_to_px(self.results.multi_hand_landmarks[hand_index])
+        else:
+            return []
+
+        return [tuple(point) for point in landmarks.tolist()]
+
+    def detect_gesture(self):
     #Detect hand gestures based on finger positions.
-        landmarks = self.get_hand_landmarks(image)
+        landmarks = self.landmarks_px
 
-        if len(landmarks) < 21:
+        if landmarks is None or len(landmarks) < 21:
             return []
 
         # Finger up detection logic
-        fingers_up = []
+        fingers_up = np.empty(5, dtype=bool)
 
         # Thumb special case (different orientation)
-        if landmarks[HandLandmark.THUMB_TIP.value][0] < landmarks[HandLandmark.THUMB_MCP.value][0]:
-            fingers_up.append(True)
-        else:
-            fingers_up.append(False)
-
-        # Other fingers
-        fingertip_landmarks = [
-            HandLandmark.INDEX_TIP.value,
-            HandLandmark.MIDDLE_TIP.value,
-            HandLandmark.RING_TIP.value,
-            HandLandmark.PINKY_TIP.value
-        ]
+        fingers_up[0] = landmarks[THUMB_TIP, 0] < landmarks[THUMB_MCP, 0]
 
-        for tip, pip in zip(fingertip_landmarks, [6, 10, 14, 18]):
-            if landmarks[tip][1] < landmarks[pip][1]:
-                fingers_up.append(True)
-            else:
-                fingers_up.append(False)
+        # Other fingers: tip above PIP joint, compared for all four at once
+        fingers_up[1:] = landmarks[FINGERTIP_LANDMARKS, 1] < landmarks[FINGER_PIP_LANDMARKS, 1]
 
-        return fingers_up
+        return fingers_up.tolist()
 
-    def get_pointing_finger(self, image):
+    def get_pointing_finger(self):
      #Get the position of the pointing finger (index finger tip).
 
-        landmarks = self.get_hand_landmarks(image)
+        landmarks = self.landmarks_px
 
-        if len(landmarks) >= 8:
-            return landmarks[HandLandmark.INDEX_TIP.value]
+        if landmarks is not None and len(landmarks) > INDEX_TIP:
+            x, y = landmarks[INDEX_TIP].tolist()
+            return x, y
 
-        return None
\ No newline at end of file
+        return None
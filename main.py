@@ -1,11 +1,16 @@
 import cv2
+import logging
 import numpy as np
 import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from frame_grabber import FrameGrabber
 from hand_tracker import EnhancedHandTracker
 from mouth_tracker import MouthTracker
 from painter import PainterUI
 
+logger = logging.getLogger(__name__)
+
 
 def create_save_directory():
     # Create a directory for saving drawings if it doesn't exist.
@@ -15,21 +20,23 @@ def create_save_directory():
 
 
 def main():
-    # Camera and application settings
-    cap = cv2.VideoCapture(0)
-    cap.set(3, 1280)  # Width
-    cap.set(4, 720)  # Height
+    # Camera and application settings (capture runs on a background thread)
+    grabber = FrameGrabber(0, width=1280, height=720).start()
 
     # Initialize hand tracker and mouth tracker
     hand_tracker = EnhancedHandTracker(detection_confidence=0.6, tracking_confidence=0.6)
     mouth_tracker = MouthTracker(detection_confidence=0.5, tracking_confidence=0.5)
 
+    # Hand and face inference are independent, so run them concurrently
+    # (both trackers use the same stride, so they infer on the same frames)
+    pool = ThreadPoolExecutor(max_workers=2)
+
     # Initialize painter UI
     painter_ui = PainterUI()
 
     # Drawing canvas initialization
-    canvas = np.zeros((720, 1280, 3), dtype=np.uint8) + 255  # White canvas
-    previous_x, previous_y = 0, 0
+    canvas = np.full((720, 1280, 3), 255, dtype=np.uint8)  # White canvas
+    previous_point = None
 
     # Save directory setup
     save_dir = create_save_directory()
@@ -40,36 +47,52 @@ def main():
     mouth_open_count = 0
     MOUTH_OPEN_THRESHOLD = 10  # Require multiple frames of mouth being open
 
-    # Smoothing variables
-    smooth_x, smooth_y = 0, 0
+    # Reusable RGB buffer for the per-frame color conversion
+    rgb_frame = None
+
+    # Smoothing state: exponentially smoothed (x, y) of the pointing finger
+    smooth = np.zeros(2, dtype=np.float32)
     alpha = 0.4  # Smoothing factor (lower = more smooth, but slower response)
 
+    # Bind cv2 functions used every frame to locals to skip module attribute lookups
+    _flip, _cvtColor, _putText, _line = cv2.flip, cv2.cvtColor, cv2.putText, cv2.line
+    _addWeighted, _imshow, _waitKey = cv2.addWeighted, cv2.imshow, cv2.waitKey
+
     while True:
         # Read frame from camera
-        success, frame = cap.read()
+        success, frame = grabber.read()
         if not success:
             break
 
         # Flip the frame horizontally for a later selfie-view display
-        frame = cv2.flip(frame, 1)
-
-        # Mouth tracking
-        frame, mouth_landmarks = mouth_tracker.detect_mouth(frame, draw=True)
-
-        # Debug: Print mouth landmarks
+        frame = _flip(frame, 1)
+
+        # Convert once and run hand and mouth inference in parallel
+        if rgb_frame is None or rgb_frame.shape != frame.shape:
+            rgb_frame = np.empty_like(frame)
+        _cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+        hands_future = pool.submit(hand_tracker.find_hands, rgb_frame)
+        mouth_future = pool.submit(mouth_tracker.find_mouth, rgb_frame)
+        hands_future.result()
+        mouth_landmarks = mouth_future.result()
+
+        # Drawing stays on the main thread since it mutates the frame
+        frame = mouth_tracker.draw_mouth(frame)
+        frame = hand_tracker.draw_hands(frame)
+
+        # Debug: Log mouth landmarks (lazy formatting, skipped unless DEBUG is enabled)
         if mouth_landmarks:
-            print(f"Mouth Landmarks: {mouth_landmarks}")
+            logger.debug("Mouth Landmarks: %s", mouth_landmarks)
 
         # Default to an empty list of fingers up
         fingers_up = []
 
-        # Hand detection and gesture recognition
-        frame = hand_tracker.detect_hands(frame)  # Update results first
+        # Gesture recognition
         if hand_tracker.results and hand_tracker.results.multi_hand_landmarks:
-            fingers_up = hand_tracker.detect_gesture(frame)
+            fingers_up = hand_tracker.detect_gesture()
 
         # Get pointing finger position
-        pointing_finger = hand_tracker.get_pointing_finger(frame)
+        pointing_finger = hand_tracker.get_pointing_finger()
 
         # Draw UI elements
         frame = painter_ui.draw_ui(frame)
@@ -78,12 +101,12 @@ def main():
         if save_cooldown > 0:
             save_cooldown -= 1
 
-        # Improved mouth open detection
-        is_mouth_open = mouth_tracker.detect_mouth_open(frame)
+        # Improved mouth open detection (reuses landmarks from find_mouth above)
+        is_mouth_open = mouth_tracker.detect_mouth_open()
 
         if is_mouth_open:
             mouth_open_count += 1
-            print(f"Mouth Open Count: {mouth_open_count}")  # Debug print
+            logger.debug("Mouth Open Count: %d", mouth_open_count)
         else:
             mouth_open_count = 0
 
@@ -98,8 +121,8 @@ def main():
             cv2.imwrite(save_path, canvas)
 
             # Add text overlay to indicate save
-            cv2.putText(frame, f"Saved: {filename}", (50, 100),
-                        cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
+            _putText(frame, f"Saved: {filename}", (50, 100),
+                     cv2.FONT_HERSHEY_SIMPLEX, 1, (0, 255, 0), 2)
 
             # Reset cooldown and mouth open count
             save_cooldown = SAVE_COOLDOWN_FRAMES
@@ -107,59 +130,57 @@ def main():
 
         # Smooth pointing finger movement
         if pointing_finger and fingers_up:
-            x, y = pointing_finger
-
-            # Exponential smoothing for cursor movement
-            smooth_x = alpha * x + (1 - alpha) * smooth_x
-            smooth_y = alpha * y + (1 - alpha) * smooth_y
+            # Exponential smoothing for cursor movement, updated in place
+            smooth *= 1 - alpha
+            smooth += alpha * np.asarray(pointing_finger, dtype=np.float32)
+            cursor = tuple(smooth.astype(np.int32).tolist())
 
             # Check UI interactions
-            interactions = painter_ui.handle_interactions(int(smooth_x), int(smooth_y), fingers_up)
+            interactions = painter_ui.handle_interactions(*cursor, fingers_up)
 
             # Clear canvas
             if interactions['clear_canvas']:
-                canvas = np.zeros((720, 1280, 3), dtype=np.uint8) + 255
+                canvas.fill(255)
 
             # Shape drawing mode
             if interactions['shape_drawing_mode'] and painter_ui.shape_start_point:
-                # Create a copy of the canvas to draw preview
-                preview_canvas = canvas.copy()
-                canvas = painter_ui.draw_shape(preview_canvas,
-                                               painter_ui.shape_start_point,
-                                               (int(smooth_x), int(smooth_y)))
+                # Draw the preview into the painter's spare buffer; the old canvas becomes the spare
+                canvas = painter_ui._swap_preview(canvas, cursor)
 
             # Drawing mode (line drawing) with smoothing
-            elif interactions['drawing_mode'] and (previous_x, previous_y) != (0, 0):
-                cv2.line(
+            elif interactions['drawing_mode'] and previous_point is not None:
+                _line(
                     canvas,
-                    (int(previous_x), int(previous_y)),
-                    (int(smooth_x), int(smooth_y)),
+                    previous_point,
+                    cursor,
                     painter_ui.current_color,
                     painter_ui.current_brush_size
                 )
 
             # Update previous coordinates
-            previous_x, previous_y = int(smooth_x), int(smooth_y)
+            previous_point = cursor
         else:
             # Reset previous coordinates when finger is not pointing
-            previous_x, previous_y = 0, 0
+            previous_point = None
 
-        # Combine canvas with frame
-        frame[120:, 50:1230] = cv2.addWeighted(frame[120:, 50:1230], 0.5, canvas[120:, 50:1230], 0.5, 0)
+        # Combine canvas with frame, blending straight into the frame region
+        frame_roi = frame[120:, 50:1230]
+        _addWeighted(frame_roi, 0.5, canvas[120:, 50:1230], 0.5, 0, dst=frame_roi)
 
         # Display some help text
-        cv2.putText(frame, "Open mouth to save drawing", (850, 50),
-                    cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
+        _putText(frame, "Open mouth to save drawing", (850, 50),
+                 cv2.FONT_HERSHEY_SIMPLEX, 0.7, (0, 0, 255), 2)
 
         # Display the frame
-        cv2.imshow("Air Virtual Drawing (Mouth Save)", frame)
+        _imshow("Air Virtual Drawing (Mouth Save)", frame)
 
         # Exit condition
-        key = cv2.waitKey(1)
+        key = _waitKey(1)
         if key == 27 or key == ord('q'):  # ESC or 'q' key
             break
 
-    cap.release()
+    pool.shutdown()
+    grabber.stop()
     cv2.destroyAllWindows()
 
 
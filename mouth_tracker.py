@@ -12,14 +12,26 @@ class MouthLandmark(Enum):
     MOUTH_CENTER_BOTTOM = 17
 
 
+# Plain int landmark indices for per-frame code (avoids Enum .value lookups)
+MOUTH_LEFT_CORNER = MouthLandmark.MOUTH_LEFT_CORNER.value
+MOUTH_RIGHT_CORNER = MouthLandmark.MOUTH_RIGHT_CORNER.value
+MOUTH_CENTER_TOP = MouthLandmark.MOUTH_CENTER_TOP.value
+MOUTH_CENTER_BOTTOM = MouthLandmark.MOUTH_CENTER_BOTTOM.value
+MOUTH_LANDMARKS = (MOUTH_LEFT_CORNER, MOUTH_RIGHT_CORNER, MOUTH_CENTER_TOP, MOUTH_CENTER_BOTTOM)
+
+
 class MouthTracker:
-    def __init__(self, detection_confidence=0.7, tracking_confidence=0.7):
+    def __init__(self, detection_confidence=0.7, tracking_confidence=0.7, input_width=640, stride=2):
         """
         Initialize MediaPipe Face Mesh for mouth tracking.
 
         :param detection_confidence: Minimum confidence for face detection
         :param tracking_confidence: Minimum confidence for face tracking
+        :param input_width: Width frames are shrunk to before inference (None keeps full size)
+        :param stride: Run inference on every stride-th frame and reuse the last result in between
         """
+        self.input_width = input_width
+        self.stride = max(1, stride)
         self.mp_face_mesh = mp.solutions.face_mesh
         self.face_mesh = self.mp_face_mesh.FaceMesh(
             max_num_faces=1,
@@ -30,40 +42,81 @@ class MouthTracker:
         self.mp_drawing = mp.solutions.drawing_utils
         self.mp_drawing_styles = mp.solutions.drawing_styles
 
-    def detect_mouth(self, image, draw=True):
-    #Detect mouth landmarks in the image.
+        # Per-frame state filled in by find_mouth
+        self._frame_idx = 0
+        self.results = None
+        self.mouth_landmarks = []
 
-        # Convert BGR to RGB
-        rgb_image = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+    def find_mouth(self, rgb_image):
+        """
+        Run face mesh inference on an RGB image and extract mouth landmarks without drawing.
+
+        :param rgb_image: Image in RGB order
+        :return: List of mouth landmark pixel coordinates (empty if no face found)
+        """
+        # Between strided frames keep the previous landmarks
+        run_inference = self._frame_idx % self.stride == 0
+        self._frame_idx += 1
+        if not run_inference and self.results is not None:
+            return self.mouth_landmarks
+
+        # Reset cached landmarks so a frame without a face never reuses stale ones
+        self.mouth_landmarks = []
+
+        # Landmarks are normalized, so inference can run on a smaller copy
+        height, width, _ = rgb_image.shape
+        if self.input_width and width > self.input_width:
+            input_height = round(height * self.input_width / width)
+            rgb_image = cv2.resize(rgb_image, (self.input_width, input_height),
+                                   interpolation=cv2.INTER_AREA)
+
+        # A read-only input is wrapped by MediaPipe instead of copied into its graph
+        rgb_image = rgb_image.view()
+        rgb_image.flags.writeable = False
 
         # Process the image and find face mesh
         self.results = self.face_mesh.process(rgb_image)
 
-        mouth_landmarks = []
-
-        # Draw and extract mouth landmarks if face is detected
+        # Extract mouth landmarks if face is detected
         if self.results.multi_face_landmarks:
             for face_landmarks in self.results.multi_face_landmarks:
-                # Extract specific mouth landmarks
-                height, width, _ = image.shape
-                mouth_landmarks = [
+                self.mouth_landmarks = [
                     (int(face_landmarks.landmark[idx].x * width),
                      int(face_landmarks.landmark[idx].y * height))
-                    for idx in [308, 78, 0, 17]  # Left corner, right corner, top center, bottom center
+                    for idx in MOUTH_LANDMARKS  # Left corner, right corner, top center, bottom center
                 ]
 
-                if draw:
-                    # Draw mouth landmarks
-                    for landmark in mouth_landmarks:
-                        cv2.circle(image, landmark, 5, (0, 255, 0), -1)
+        return self.mouth_landmarks
+
+    def draw_mouth(self, image):
+        # Draw the mouth landmarks found by the last find_mouth call.
+        for landmark in self.mouth_landmarks:
+            cv2.circle(image, landmark, 5, (0, 255, 0), -1)
+
+        return image
+
+    def detect_mouth(self, image, draw=True, rgb=None):
+    #Detect mouth landmarks in the image.
+    #Pass rgb to reuse an RGB copy of the frame that was already converted.
+
+        # Convert BGR to RGB
+        if rgb is None:
+            rgb = cv2.cvtColor(image, cv2.COLOR_BGR2RGB)
+
+        mouth_landmarks = self.find_mouth(rgb)
+
+        if draw:
+            # Draw mouth landmarks
+            self.draw_mouth(image)
 
         return image, mouth_landmarks
 
-    def detect_mouth_open(self, image):
+    def detect_mouth_open(self, mouth_landmarks=None):
        #Detect if mouth is open by calculating vertical mouth distance.
+       #Uses the landmarks cached by the last find_mouth call unless given explicitly.
 
-
-        _, mouth_landmarks = self.detect_mouth(image, draw=False)
+        if mouth_landmarks is None:
+            mouth_landmarks = self.mouth_landmarks
 
         if len(mouth_landmarks) >= 4:
             # Calculate vertical distance between mouth top and bottom
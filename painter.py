@@ -26,6 +26,38 @@ class UIElement:
         self.text_color = text_color
         self.is_visible = True
 
+        # Gradient overlay cache, keyed by the (w, h, color) it was built for
+        self._gradient_key = None
+        self._gradient = None
+
+        # Label size and centered offset for the default font, computed once
+        self._text_size = None
+        self._text_offset = None
+        if text:
+            self._text_size = cv2.getTextSize(text, cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)[0]
+            self._text_offset = self._center_text(w, h, self._text_size)
+
+    @staticmethod
+    def _center_text(w, h, text_size):
+        # Offset of the text origin that centers text_size inside a w x h box.
+        return (w - text_size[0]) // 2, (h + text_size[1]) // 2
+
+    def _get_gradient(self, w, h):
+        """
+        Return the vertical gradient overlay for a w x h region, building it only when needed.
+
+        :param w: Width of the region
+        :param h: Height of the region
+        :return: (h, w, 3) uint8 gradient from darker to lighter shade of the base color
+        """
+        key = (w, h, self.color)
+        if self._gradient_key != key:
+            shade = 0.5 + (np.arange(h) / h)[:, None] * 0.5
+            rows = (np.asarray(self.color, dtype=np.float64) * shade).astype(np.uint8)
+            self._gradient = np.ascontiguousarray(np.broadcast_to(rows[:, None, :], (h, w, 3)))
+            self._gradient_key = key
+        return self._gradient
+
     def draw(self, image, font_face=cv2.FONT_HERSHEY_SIMPLEX,
              font_scale=0.7, thickness=2):
         """
@@ -54,33 +86,68 @@ class UIElement:
         # Extract the region of interest
         roi = image[self.y:y_end, self.x:x_end]
 
-        # Create a soft gradient overlay
-        overlay = np.zeros(roi.shape, dtype=np.uint8)
-        for i in range(h):
-            # Create a gradient from darker to lighter shade of the base color
-            alpha = i / h
-            gradient_color = tuple(int(c * (0.5 + alpha * 0.5)) for c in self.color)
-            overlay[i, :] = gradient_color
+        # Blend a soft gradient overlay (cached across frames) into the region in place;
+        # fully opaque elements keep the image as is and never need the gradient
+        if self.alpha < 0.999:
+            overlay = self._get_gradient(w, h)
+            cv2.addWeighted(roi, self.alpha, overlay, 1 - self.alpha, 0.0, dst=roi)
+
+        # Add borders and text on top
+        self.draw_decor(image, w, h, font_face=font_face,
+                        font_scale=font_scale, thickness=thickness)
+
+        return image
+
+    def draw_decor(self, image, w, h, mask=None,
+                   font_face=cv2.FONT_HERSHEY_SIMPLEX, font_scale=0.7, thickness=2):
+        """
+        Draw the borders and text of the element, optionally marking them in a mask.
 
-        # Blend the original image with the overlay
-        blended = cv2.addWeighted(roi, self.alpha, overlay, 1 - self.alpha, 1.0)
+        :param image: Image to draw on
+        :param w: Visible width of the element
+        :param h: Visible height of the element
+        :param mask: Optional single-channel mask set to 255 wherever decor is drawn
+        :param font_face: OpenCV font type
+        :param font_scale: Font size scale
+        :param thickness: Text thickness
+        :return: Modified image
+        """
+        x = self.x
+        y = self.y
 
-        # Add rounded rectangle effect
-        cv2.rectangle(blended, (5, 5), (w - 5, h - 5),
+        if self.text:
+            # The label size and offset cached in __init__ are only valid for the default font
+            use_cached = (font_face, font_scale, thickness) == (cv2.FONT_HERSHEY_SIMPLEX, 0.7, 2)
+            if use_cached:
+                text_size = self._text_size
+            else:
+                text_size = cv2.getTextSize(self.text, font_face, font_scale, thickness)[0]
+
+            if use_cached and (w, h) == (self.w, self.h):
+                offset_x, offset_y = self._text_offset
+            else:
+                offset_x, offset_y = self._center_text(w, h, text_size)
+            text_x = x + offset_x
+            text_y = y + offset_y
+
+        # Add rounded rectangle effect, clipped to the element
+        region = image[y:y + h, x:x + w]
+        cv2.rectangle(region, (5, 5), (w - 5, h - 5),
                       (200, 200, 200), 2)  # Highlight border
-        cv2.rectangle(blended, (0, 0), (w, h),
+        cv2.rectangle(region, (0, 0), (w, h),
                       (100, 100, 100), 1)  # Soft outer border
-
-        # Put the blended region back
-        image[self.y:y_end, self.x:x_end] = blended
+        if mask is not None:
+            mask_region = mask[y:y + h, x:x + w]
+            cv2.rectangle(mask_region, (5, 5), (w - 5, h - 5), 255, 2)
+            cv2.rectangle(mask_region, (0, 0), (w, h), 255, 1)
 
         # Add text if present
         if self.text:
-            text_size = cv2.getTextSize(self.text, font_face, font_scale, thickness)
-            text_x = int(self.x + w / 2 - text_size[0][0] / 2)
-            text_y = int(self.y + h / 2 + text_size[0][1] / 2)
             cv2.putText(image, self.text, (text_x, text_y),
                         font_face, font_scale, self.text_color, thickness)
+            if mask is not None:
+                cv2.putText(mask, self.text, (text_x, text_y),
+                            font_face, font_scale, 255, thickness)
 
         return image
 
@@ -237,29 +304,167 @@ class PainterUI:
         self.shape_start_point = None
         self.shape_drawing_mode = False
 
+        # Pre-rendered panel layers, built lazily by _get_panel and keyed by
+        # the visibility of the panel's elements
+        self._panel_cache = {}
+
+        # Spare buffer for shape previews, swapped with main()'s canvas by _swap_preview
+        self._preview = np.empty((height, width, 3), dtype=np.uint8)
+
+        # Row geometry of each button panel, used by _hit_test
+        self._panel_layouts = {
+            'toggles': self._panel_layout(self.toggle_buttons),
+            'colors': self._panel_layout(self.colors),
+            'pen_sizes': self._panel_layout(self.pen_sizes),
+            'shapes': self._panel_layout(self.shapes),
+        }
+
+    @staticmethod
+    def _panel_layout(elements):
+        """
+        Describe a horizontal row of evenly spaced buttons.
+
+        Buttons must share y and h, start every `step` pixels and be no wider
+        than `step`, except the last one which may be wider.
+
+        :param elements: Buttons of the panel, left to right
+        :return: (first x, step between buttons, top y, bottom y)
+        """
+        first = elements[0]
+        step = elements[1].x - first.x if len(elements) > 1 else first.w
+        return first.x, step, first.y, first.y + first.h
+
+    def _hit_test(self, panel, elements, x, y):
+        """
+        Find the button of a panel under a point without scanning every button.
+
+        :param panel: Name of the panel layout
+        :param elements: Buttons of the panel
+        :param x: X-coordinate of the point
+        :param y: Y-coordinate of the point
+        :return: The button under the point, or None
+        """
+        base_x, step, top, bottom = self._panel_layouts[panel]
+
+        # Whole panel shares one row, so reject on y first
+        if not (top < y < bottom):
+            return None
+
+        # Only the button whose slot contains x can be hit
+        index = min(max((x - base_x) // step, 0), len(elements) - 1)
+        button = elements[index]
+        return button if button.is_over(x, y) else None
+
+    def _render_panel(self, elements):
+        """
+        Render a group of UI elements once into a reusable layer.
+
+        Elements of a panel are expected to share the same alpha.
+
+        :param elements: UI elements belonging to the panel
+        :return: Dict with the panel bounds, BGR layer, uint8 blend and decor masks, alpha and blend buffer
+        """
+        layer = np.zeros((self.height, self.width, 3), dtype=np.uint8)
+        blend_mask = np.zeros((self.height, self.width), dtype=np.uint8)
+        decor_mask = np.zeros((self.height, self.width), dtype=np.uint8)
+
+        for element in elements:
+            if not element.is_visible:
+                continue
+
+            y_end = min(element.y + element.h, self.height)
+            x_end = min(element.x + element.w, self.width)
+            h = y_end - element.y
+            w = x_end - element.x
+            if h <= 0 or w <= 0:
+                continue
+
+            # Opaque elements are never blended, so only translucent ones need the gradient.
+            # Keep decor (e.g. overflowing text) already drawn by earlier elements
+            if element.alpha < 0.999:
+                np.copyto(layer[element.y:y_end, element.x:x_end], element._get_gradient(w, h),
+                          where=decor_mask[element.y:y_end, element.x:x_end, None] == 0)
+            blend_mask[element.y:y_end, element.x:x_end] = 255
+            element.draw_decor(layer, w, h, mask=decor_mask)
+
+        # Crop everything to the area actually touched by the panel
+        ys, xs = np.nonzero(blend_mask | decor_mask)
+        if len(ys) == 0:
+            return None
+        y0, y1 = ys.min(), ys.max() + 1
+        x0, x1 = xs.min(), xs.max() + 1
+
+        blend_mask = blend_mask[y0:y1, x0:x1].copy()
+
+        return {
+            'bounds': (x0, y0, x1, y1),
+            'layer': layer[y0:y1, x0:x1].copy(),
+            'blend_mask': blend_mask,
+            'blend_full': bool(blend_mask.all()),
+            'decor_mask': decor_mask[y0:y1, x0:x1].copy(),
+            'alpha': elements[0].alpha,
+            'scratch': np.empty((y1 - y0, x1 - x0, 3), dtype=np.uint8),
+        }
+
+    def _get_panel(self, name, elements):
+        # Return the cached layer for a panel, rendering it again when element visibility changes.
+        visibility = tuple(element.is_visible for element in elements)
+        cached = self._panel_cache.get(name)
+        if cached is None or cached[0] != visibility:
+            cached = (visibility, self._render_panel(elements))
+            self._panel_cache[name] = cached
+        return cached[1]
+
+    def _blit_panel(self, image, panel):
+        # Composite a pre-rendered panel onto the image.
+        if panel is None:
+            return image
+
+        x0, y0, x1, y1 = panel['bounds']
+        y1 = min(y1, image.shape[0])
+        x1 = min(x1, image.shape[1])
+        if y1 <= y0 or x1 <= x0:
+            return image
+
+        h = y1 - y0
+        w = x1 - x0
+        roi = image[y0:y1, x0:x1]
+        layer = panel['layer'][:h, :w]
+
+        # Blend element backgrounds with the camera image (a no-op for opaque panels),
+        # then stamp borders and text
+        alpha = panel['alpha']
+        if alpha < 0.999:
+            if panel['blend_full']:
+                # The panel is one solid element, so blend straight into the image
+                cv2.addWeighted(roi, alpha, layer, 1 - alpha, 0.0, dst=roi)
+            else:
+                blended = panel['scratch'][:h, :w]
+                cv2.addWeighted(roi, alpha, layer, 1 - alpha, 0.0, dst=blended)
+                cv2.copyTo(blended, panel['blend_mask'][:h, :w], roi)
+        cv2.copyTo(layer, panel['decor_mask'][:h, :w], roi)
+
+        return image
+
     def draw_ui(self, image):
 
         # Draw toggle buttons
-        for btn in self.toggle_buttons:
-            btn.draw(image)
+        self._blit_panel(image, self._get_panel('toggles', self.toggle_buttons))
 
         # Draw board (optional, can be toggled)
-        self.canvas.draw(image)
+        self._blit_panel(image, self._get_panel('board', [self.canvas]))
 
         # Draw color palette if not hidden
         if not self.hide_colors:
-            for color_btn in self.colors:
-                color_btn.draw(image)
+            self._blit_panel(image, self._get_panel('colors', self.colors))
 
         # Draw pen sizes if not hidden
         if not self.hide_pen_sizes:
-            for pen_size in self.pen_sizes:
-                pen_size.draw(image)
+            self._blit_panel(image, self._get_panel('pen_sizes', self.pen_sizes))
 
         # Draw shape buttons if not hidden
         if not self.hide_shapes:
-            for shape_btn in self.shapes:
-                shape_btn.draw(image)
+            self._blit_panel(image, self._get_panel('shapes', self.shapes))
 
         return image
 
@@ -283,51 +488,47 @@ class PainterUI:
 
         # Check toggle buttons
         if fingers_up[1]:  # Index finger
-            for btn in self.toggle_buttons:
-                if btn.is_over(x, y):
-                    action = self.button_actions.get(btn.text)
-
-                    # Handle special actions
-                    if action == 'hide_colors':
-                        self.hide_colors = not self.hide_colors
-                    elif action == 'hide_shapes':
-                        self.hide_shapes = not self.hide_shapes
-                    elif action == 'hide_pen_sizes':
-                        self.hide_pen_sizes = not self.hide_pen_sizes
-                    elif action == 'clear_canvas':
-                        interactions['clear_canvas'] = True
-                    elif action == 'save_drawing':
-                        interactions['save_drawing'] = True
-                    break
+            btn = self._hit_test('toggles', self.toggle_buttons, x, y)
+            if btn:
+                action = self.button_actions.get(btn.text)
+
+                # Handle special actions
+                if action == 'hide_colors':
+                    self.hide_colors = not self.hide_colors
+                elif action == 'hide_shapes':
+                    self.hide_shapes = not self.hide_shapes
+                elif action == 'hide_pen_sizes':
+                    self.hide_pen_sizes = not self.hide_pen_sizes
+                elif action == 'clear_canvas':
+                    interactions['clear_canvas'] = True
+                elif action == 'save_drawing':
+                    interactions['save_drawing'] = True
 
         # Color selection
         if not self.hide_colors and fingers_up[1]:
-            for color_btn in self.colors:
-                if color_btn.is_over(x, y):
-                    if color_btn.text == "Eraser":
-                        self.current_color = self.canvas_background_color  # Set color to canvas background
-                        self.current_brush_size = 20  # Set a larger size for eraser
-                    else:
-                        self.current_color = color_btn.color
-                        self.current_brush_size = 5
-                    interactions['color_changed'] = True
-                    break
+            color_btn = self._hit_test('colors', self.colors, x, y)
+            if color_btn:
+                if color_btn.text == "Eraser":
+                    self.current_color = self.canvas_background_color  # Set color to canvas background
+                    self.current_brush_size = 20  # Set a larger size for eraser
+                else:
+                    self.current_color = color_btn.color
+                    self.current_brush_size = 5
+                interactions['color_changed'] = True
 
         # Pen size selection
         if not self.hide_pen_sizes and fingers_up[1]:
-            for pen_size_btn in self.pen_sizes:
-                if pen_size_btn.is_over(x, y):
-                    self.current_brush_size = int(pen_size_btn.text)
-                    interactions['brush_size_changed'] = True
-                    break
+            pen_size_btn = self._hit_test('pen_sizes', self.pen_sizes, x, y)
+            if pen_size_btn:
+                self.current_brush_size = int(pen_size_btn.text)
+                interactions['brush_size_changed'] = True
 
         # Shape selection
         if not self.hide_shapes and fingers_up[1]:
-            for shape_btn in self.shapes:
-                if shape_btn.is_over(x, y):
-                    self.current_shape = shape_btn.text
-                    self.shape_drawing_mode = False
-                    break
+            shape_btn = self._hit_test('shapes', self.shapes, x, y)
+            if shape_btn:
+                self.current_shape = shape_btn.text
+                self.shape_drawing_mode = False
 
         # Drawing mode
         if self.canvas.is_over(x, y):
@@ -385,4 +586,25 @@ class PainterUI:
             ], np.int32)
             cv2.polylines(canvas, [points], True, self.current_color, self.current_brush_size)
 
-        return canvas
\ No newline at end of file
+        return canvas
+
+    def _swap_preview(self, canvas, end_point):
+        """
+        Draw the selected shape on a copy of the canvas, double-buffering with main()'s canvas.
+
+        The returned array must replace the caller's canvas: the passed canvas is kept as
+        the spare buffer and overwritten by the next call.
+
+        :param canvas: Current canvas, handed over to the painter
+        :param end_point: Ending point of shape
+        :return: New canvas with the shape drawn
+        """
+        if self._preview.shape != canvas.shape:
+            self._preview = np.empty_like(canvas)
+
+        np.copyto(self._preview, canvas)
+        preview = self.draw_shape(self._preview, self.shape_start_point, end_point)
+
+        # Double-buffer: reuse the old canvas for the next preview
+        self._preview = canvas
+        return preview